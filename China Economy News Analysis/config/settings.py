@@ -1,34 +1,71 @@
 """Application settings and configuration."""
 
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
-# Database
-DATABASE_PATH = os.getenv("DATABASE_PATH", str(DATA_DIR / "news.db"))
-BACKUP_PATH = os.getenv("BACKUP_PATH", str(DATA_DIR / "backups"))
 
-# Application
-APP_ENV = os.getenv("APP_ENV", "development")
-DEBUG = os.getenv("DEBUG", "true").lower() == "true"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of environment-derived configuration."""
+
+    database_path: str
+    backup_path: str
+    app_env: str
+    debug: bool
+    log_level: str
+    anthropic_api_key: str
+    claude_model: str
+    max_tokens: int
+    crawl_interval_hours: int
+    max_news_per_source: int
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse .env / environment once and cache the result.
+
+    Tests can override the environment and call get_settings.cache_clear().
+    """
+    load_dotenv()
+    return Settings(
+        database_path=os.getenv("DATABASE_PATH", str(DATA_DIR / "news.db")),
+        backup_path=os.getenv("BACKUP_PATH", str(DATA_DIR / "backups")),
+        app_env=os.getenv("APP_ENV", "development"),
+        debug=os.getenv("DEBUG", "true").lower() == "true",
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
+        claude_model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514"),
+        max_tokens=int(os.getenv("MAX_TOKENS", "4096")),
+        crawl_interval_hours=int(os.getenv("CRAWL_INTERVAL_HOURS", "1")),
+        max_news_per_source=int(os.getenv("MAX_NEWS_PER_SOURCE", "20")),
+    )
+
+
+_settings = get_settings()
 
-# Claude API
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
-MAX_TOKENS = int(os.getenv("MAX_TOKENS", "4096"))
+# Module-level names kept for backward compatibility
+DATABASE_PATH = _settings.database_path
+BACKUP_PATH = _settings.backup_path
 
-# Crawler
-CRAWL_INTERVAL_HOURS = int(os.getenv("CRAWL_INTERVAL_HOURS", "1"))
-MAX_NEWS_PER_SOURCE = int(os.getenv("MAX_NEWS_PER_SOURCE", "20"))
+APP_ENV = _settings.app_env
+DEBUG = _settings.debug
+LOG_LEVEL = _settings.log_level
+
+ANTHROPIC_API_KEY = _settings.anthropic_api_key
+CLAUDE_MODEL = _settings.claude_model
+MAX_TOKENS = _settings.max_tokens
+
+CRAWL_INTERVAL_HOURS = _settings.crawl_interval_hours
+MAX_NEWS_PER_SOURCE = _settings.max_news_per_source
 
 # Request settings
 REQUEST_TIMEOUT = 30
@@ -36,6 +73,9 @@ REQUEST_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    # Compressed transfer: urllib3 decompresses transparently (br needs the
+    # brotli package); large portal pages arrive 4-6x smaller on the wire
+    "Accept-Encoding": "br, gzip, deflate",
 }
 
 # Industry keywords for filtering
@@ -58,3 +98,24 @@ CONTENT_TYPE_KEYWORDS = {
     "market": ["股价", "涨跌", "交易", "融资", "投资"],
     "opinion": ["分析", "评论", "观点", "预测", "展望"],
 }
+
+# Precompiled alternation patterns (one C-level scan per bucket instead of
+# one Python-level `in` check per keyword)
+INDUSTRY_PATTERNS = {
+    bucket: re.compile("|".join(re.escape(kw) for kw in keywords))
+    for bucket, keywords in INDUSTRY_KEYWORDS.items()
+}
+CONTENT_TYPE_PATTERNS = {
+    bucket: re.compile("|".join(re.escape(kw) for kw in keywords))
+    for bucket, keywords in CONTENT_TYPE_KEYWORDS.items()
+}
+
+
+def classify_industry(text: str) -> str | None:
+    """Return the first industry bucket whose pattern matches, or None."""
+    if not text:
+        return None
+    for bucket, pattern in INDUSTRY_PATTERNS.items():
+        if pattern.search(text):
+            return bucket
+    return None
@@ -8,11 +8,10 @@ by the edition-based selection pipeline (daily_news_selector.py) triggered via c
 import argparse
 import sys
 from pathlib import Path
-from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from src.database.models import init_db, get_connection
+from src.database.models import init_db
 from src.collector.crawler import NewsCrawler
 
 
@@ -24,9 +23,8 @@ def main():
                         help="Run crawl + enrich (selection is now managed by edition cron)")
     args = parser.parse_args()
 
-    if args.init_db or not Path("data/news.db").exists():
-        print("Initializing database...")
-        init_db()
+    # init_db is self-guarded via PRAGMA user_version, so always call it
+    init_db()
 
     if args.auto:
         args.crawl = True
@@ -38,21 +36,11 @@ def main():
         print(f"\n수집 완료: 총 {results['total']}개, 신규 {results['new']}개")
 
         # Enrich: fetch full article content for items with empty content
+        # (missing published_at is backfilled inside crawl_all's transaction)
         print("\n원문 본문 수집 중...")
         enriched = crawler.enrich_news_content(limit=50)
         print(f"✓ {enriched}건 원문 수집 완료")
 
-        # Fill in missing published_at
-        conn = get_connection()
-        cursor = conn.cursor()
-        now = datetime.now()
-        cursor.execute(
-            "UPDATE news SET published_at = ? WHERE published_at IS NULL",
-            (now,)
-        )
-        conn.commit()
-        conn.close()
-
     if not any([args.init_db, args.crawl, args.auto]):
         parser.print_help()
 
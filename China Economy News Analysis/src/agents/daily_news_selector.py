@@ -51,71 +51,95 @@ EDITION_CONFIG = {
 }
 
 
+# Edition windows as constant "HH:MM:SS" pairs — EDITION_CONFIG never changes
+# at runtime, so the datetime.combine/strftime work is done once at import.
+_EDITION_WINDOW_STR = {
+    edition: (
+        config['start'].strftime("%H:%M:%S"),
+        config['end'].strftime("%H:%M:%S"),
+    )
+    for edition, config in EDITION_CONFIG.items()
+}
+
+
+# Hour-of-day → edition lookup (00-06 morning, 07-13 afternoon, 14-23 evening)
+_HOUR_TO_EDITION = ('morning',) * 7 + ('afternoon',) * 7 + ('evening',) * 10
+
+
+# Central government sources excluded from expert review. Loaded into a
+# session-scoped temp table so the candidate query text stays fixed (one
+# cached plan) even if this list grows.
+EXCLUDED_SOURCES = ('ndrc', 'pboc', 'mofcom', 'nbs', 'gov', 'xinhuanet')
+
+
+def _ensure_excluded_sources(conn):
+    """Create and populate the per-connection excluded_sources temp table."""
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS excluded_sources (name TEXT PRIMARY KEY)"
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO excluded_sources VALUES (?)",
+        [(s,) for s in EXCLUDED_SOURCES],
+    )
+
+
 def get_current_edition() -> str:
     """Determine the current edition based on the current time."""
-    now = datetime.now().time()
-    if now < time(7, 0):
-        return 'morning'
-    elif now < time(14, 0):
-        return 'afternoon'
-    else:
-        return 'evening'
+    return _HOUR_TO_EDITION[datetime.now().hour]
 
 
 def get_edition_time_window(edition: str, target_date=None):
     """Return (start_datetime_str, end_datetime_str) for the given edition."""
     if target_date is None:
         target_date = datetime.now().date()
-    config = EDITION_CONFIG[edition]
-    start_dt = datetime.combine(target_date, config['start'])
-    end_dt = datetime.combine(target_date, config['end'])
-    return start_dt.strftime("%Y-%m-%d %H:%M:%S"), end_dt.strftime("%Y-%m-%d %H:%M:%S")
+    start_str, end_str = _EDITION_WINDOW_STR[edition]
+    return f"{target_date} {start_str}", f"{target_date} {end_str}"
 
 
 # ---------------------------------------------------------------------------
 # Core selection functions
 # ---------------------------------------------------------------------------
 
-def get_eligible_candidates(conn, edition: str) -> list:
-    """Fetch eligible news candidates for the given edition's time window.
+def get_eligible_candidates(conn, edition: str, batch_size: int = 1000):
+    """Yield eligible news candidates for the given edition's time window.
 
     Only considers articles whose published_at falls within the edition's
     time range and that have not been assigned to any edition yet.
+    Streams rows in fetchmany() batches instead of materializing the whole
+    window, so large windows don't double peak memory before filter_news.
     """
+    _ensure_excluded_sources(conn)
     cursor = conn.cursor()
     window_start, window_end = get_edition_time_window(edition)
 
-    # Central government sources excluded from expert review
-    excluded_sources = ('ndrc', 'pboc', 'mofcom', 'nbs', 'gov', 'xinhuanet')
-
+    # Predicate mirrors the idx_news_queue_window partial index (models.init_db)
+    # so SQLite can do a ranged published_at lookup over the unqueued subset.
+    # Source exclusion reads the excluded_sources temp table, keeping the
+    # statement text stable regardless of list length.
     cursor.execute("""
         SELECT id, original_title, original_content, published_at, source
         FROM news
         WHERE
             analyzed_at IS NOT NULL
-            AND (expert_review_status = 'none' OR expert_review_status IS NULL)
-            AND expert_review_status != 'skipped'
-            AND published_at IS NOT NULL
-            AND published_at >= ?
-            AND published_at <= ?
             AND edition IS NULL
+            AND (expert_review_status IS NULL OR expert_review_status = 'none')
             AND importance_score <= 1.0
+            AND published_at >= ?
+            AND published_at <= ?
             AND COALESCE(translated_title, '') != ''
-            AND source NOT IN (?, ?, ?, ?, ?, ?)
+            AND source NOT IN (SELECT name FROM excluded_sources)
         ORDER BY published_at DESC
-    """, (window_start, window_end, *excluded_sources))
+    """, (window_start, window_end))
 
-    candidates = []
-    for row in cursor.fetchall():
-        candidates.append({
-            'id': row['id'],
-            'original_title': row['original_title'] or '',
-            'original_content': row['original_content'] or '',
-            'published_at': row['published_at'],
-            'source': row['source'] or '',
-        })
-
-    return candidates
+    while batch := cursor.fetchmany(batch_size):
+        for row in batch:
+            yield {
+                'id': row['id'],
+                'original_title': row['original_title'] or '',
+                'original_content': row['original_content'] or '',
+                'published_at': row['published_at'],
+                'source': row['source'] or '',
+            }
 
 
 def select_edition_news(edition: str, target_count: int = 10) -> list:
@@ -132,14 +156,13 @@ def select_edition_news(edition: str, target_count: int = 10) -> list:
     try:
         candidates = get_eligible_candidates(conn, edition)
 
-        if not candidates:
-            logger.warning(f"[{edition}] No eligible candidates found")
-            return []
+        # Apply the canonical filtering pipeline (consumes the candidate stream)
+        filtered = filter_news(candidates)
 
-        logger.info(f"[{edition}] Found {len(candidates)} eligible candidates")
+        if not filtered:
+            logger.warning(f"[{edition}] No eligible candidates passed filtering")
+            return []
 
-        # Apply the canonical filtering pipeline
-        filtered = filter_news(candidates)
         logger.info(f"[{edition}] After filter_news: {len(filtered)} items")
 
         selected = balance_categories(filtered, target_count=target_count)
@@ -171,18 +194,24 @@ def update_selected_status(news_ids: list, edition: str) -> int:
     cursor = conn.cursor()
 
     try:
-        placeholders = ",".join("?" * len(news_ids))
-        cursor.execute(f"""
-            UPDATE news
-            SET expert_review_status = 'queued_today',
-                edition = ?,
-                updated_at = ?
-            WHERE id IN ({placeholders})
-        """, [edition, datetime.now()] + news_ids)
+        # Fixed statement text + executemany: SQLite reuses one prepared
+        # plan instead of re-planning a different-length IN (...) each call.
+        with conn:
+            cursor.executemany("""
+                UPDATE news
+                SET expert_review_status = 'queued_today',
+                    edition = ?,
+                    updated_at = datetime('now', 'localtime')
+                WHERE id = ?
+            """, [(edition, news_id) for news_id in news_ids])
 
-        conn.commit()
         updated = cursor.rowcount
         logger.info(f"[{edition}] Updated {updated} news items to 'queued_today'")
+
+        # Edition contents changed — drop cached feed results
+        from src.api.public_feed import invalidate_feed_cache
+        invalidate_feed_cache()
+
         return updated
 
     finally:
@@ -202,15 +231,14 @@ def reset_stale_queue() -> int:
     cursor = conn.cursor()
 
     try:
-        today_str = datetime.now().strftime("%Y-%m-%d")
         cursor.execute("""
             UPDATE news
             SET expert_review_status = 'none',
                 edition = NULL,
-                updated_at = ?
+                updated_at = datetime('now', 'localtime')
             WHERE expert_review_status = 'queued_today'
-              AND DATE(updated_at) < ?
-        """, (datetime.now(), today_str))
+              AND DATE(updated_at) < DATE('now', 'localtime')
+        """)
 
         conn.commit()
         reset_count = cursor.rowcount
@@ -4,20 +4,33 @@ Provides functions to retrieve expert-reviewed news for public consumption.
 Supports 3-edition-per-day publishing (morning/afternoon/evening).
 """
 
+import json
 import sqlite3
+import threading
+import time
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, date
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
-from config.settings import DATABASE_PATH
+from config.settings import get_settings
+from src.database.models import configure_connection
+
+# One read connection per thread: avoids sqlite3_open + pragma reinit on
+# every feed call. Read functions must NOT close these connections.
+_local = threading.local()
 
 
 def get_connection() -> sqlite3.Connection:
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get this thread's cached read connection (pragmas applied once)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(get_settings().database_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        configure_connection(conn)
+        _local.conn = conn
     return conn
 
 
@@ -63,18 +76,65 @@ def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
         INNER JOIN expert_reviews er ON n.id = er.news_id
         WHERE er.expert_comment IS NOT NULL
           AND er.publish_status = 'published'
-          AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
+          AND n.content_length > 0
         ORDER BY n.published_at DESC
         LIMIT ? OFFSET ?
     """
 
     cursor.execute(query, (limit, offset))
     rows = cursor.fetchall()
-    conn.close()
 
     return [dict(row) for row in rows]
 
 
+def get_published_news_with_count(limit: int = 10, offset: int = 0) -> tuple[list[dict], int]:
+    """Retrieve a page of published news plus the total count in one query.
+
+    Uses COUNT(*) OVER () so SQLite walks the join once instead of running
+    a separate COUNT(*) query per page load.
+
+    Returns:
+        (rows, total) where rows matches get_published_news() output.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    query = """
+        SELECT
+            n.id,
+            n.card_headline,
+            n.translated_title AS headline,
+            er.expert_comment AS expert_review,
+            n.original_content AS original_article,
+            n.source,
+            n.published_at AS date,
+            n.importance_score AS importance,
+            n.industry_category AS category,
+            n.summary,
+            n.edition,
+            COUNT(*) OVER () AS _total
+        FROM news n
+        INNER JOIN expert_reviews er ON n.id = er.news_id
+        WHERE er.expert_comment IS NOT NULL
+          AND er.publish_status = 'published'
+          AND n.content_length > 0
+        ORDER BY n.published_at DESC
+        LIMIT ? OFFSET ?
+    """
+
+    cursor.execute(query, (limit, offset))
+    rows = [dict(row) for row in cursor.fetchall()]
+
+    if not rows:
+        # Page past the end (or nothing published): fall back to the count query
+        return [], get_published_news_count()
+
+    total = rows[0]["_total"]
+    for row in rows:
+        row.pop("_total", None)
+    return rows, total
+
+
 def get_published_news_count() -> int:
     """Get total count of published (expert-reviewed) news.
 
@@ -90,12 +150,11 @@ def get_published_news_count() -> int:
         INNER JOIN expert_reviews er ON n.id = er.news_id
         WHERE er.expert_comment IS NOT NULL
           AND er.publish_status = 'published'
-          AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
+          AND n.content_length > 0
     """
 
     cursor.execute(query)
     count = cursor.fetchone()[0]
-    conn.close()
 
     return count
 
@@ -132,12 +191,11 @@ def get_news_by_id(news_id: int) -> Optional[dict]:
         INNER JOIN expert_reviews er ON n.id = er.news_id
         WHERE n.id = ? AND er.expert_comment IS NOT NULL
           AND er.publish_status = 'published'
-          AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
+          AND n.content_length > 0
     """
 
     cursor.execute(query, (news_id,))
     row = cursor.fetchone()
-    conn.close()
 
     return dict(row) if row else None
 
@@ -172,7 +230,7 @@ def get_published_news_by_date(target_date: date, limit: int = 50) -> list[dict]
         INNER JOIN expert_reviews er ON n.id = er.news_id
         WHERE er.expert_comment IS NOT NULL
           AND er.publish_status = 'published'
-          AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
+          AND n.content_length > 0
           AND DATE(n.published_at) = ?
         ORDER BY n.importance_score DESC, n.published_at DESC
         LIMIT ?
@@ -180,14 +238,17 @@ def get_published_news_by_date(target_date: date, limit: int = 50) -> list[dict]
 
     cursor.execute(query, (target_date.isoformat(), limit))
     rows = cursor.fetchall()
-    conn.close()
 
     return [dict(row) for row in rows]
 
 
+@lru_cache(maxsize=1)
 def get_available_dates() -> list[str]:
     """Get list of dates that have published news.
 
+    Cached until invalidate_feed_cache() is called: the underlying data only
+    changes when an edition is selected or a review is published.
+
     Returns:
         List of date strings (ISO format) in descending order
     """
@@ -200,13 +261,12 @@ def get_available_dates() -> list[str]:
         INNER JOIN expert_reviews er ON n.id = er.news_id
         WHERE er.expert_comment IS NOT NULL
           AND er.publish_status = 'published'
-          AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
+          AND n.content_length > 0
         ORDER BY news_date DESC
     """
 
     cursor.execute(query)
     rows = cursor.fetchall()
-    conn.close()
 
     return [row['news_date'] for row in rows if row['news_date']]
 
@@ -221,6 +281,23 @@ EDITION_TITLES = {
     'evening': '오늘 밤 뉴스 헤드라인',
 }
 
+# Hour-of-day → edition lookup (00-06 morning, 07-13 afternoon, 14-23 evening)
+_HOUR_TO_EDITION = ('morning',) * 7 + ('afternoon',) * 7 + ('evening',) * 10
+
+# In-memory TTL cache for headline queries: (date_iso, edition) -> (expires, data)
+_HEADLINE_CACHE: dict = {}
+_HEADLINE_CACHE_TTL = 300  # seconds
+
+# Serialized companion cache: (date_iso, edition) -> (expires, utf-8 JSON bytes)
+_HEADLINE_JSON_CACHE: dict = {}
+
+
+def invalidate_feed_cache():
+    """Drop cached feed results after an edition selection or review publish."""
+    get_available_dates.cache_clear()
+    _HEADLINE_CACHE.clear()
+    _HEADLINE_JSON_CACHE.clear()
+
 
 def get_today_headlines(target_date: Optional[date] = None, edition: Optional[str] = None) -> dict:
     """Get headlines summary for a specific edition.
@@ -237,13 +314,13 @@ def get_today_headlines(target_date: Optional[date] = None, edition: Optional[st
 
     # Auto-detect edition based on current time
     if edition is None:
-        current_hour = datetime.now().hour
-        if current_hour < 7:
-            edition = 'morning'
-        elif current_hour < 14:
-            edition = 'afternoon'
-        else:
-            edition = 'evening'
+        edition = _HOUR_TO_EDITION[datetime.now().hour]
+
+    # Serve from cache while fresh (data changes only 3x/day via edition cron)
+    cache_key = (target_date.isoformat(), edition)
+    cached = _HEADLINE_CACHE.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
 
     title = EDITION_TITLES.get(edition, '오늘 뉴스 헤드라인')
 
@@ -270,7 +347,6 @@ def get_today_headlines(target_date: Optional[date] = None, edition: Optional[st
 
     cursor.execute(query, (target_date.isoformat(), edition))
     rows = cursor.fetchall()
-    conn.close()
 
     headlines = []
     for i, row in enumerate(rows, 1):
@@ -282,13 +358,40 @@ def get_today_headlines(target_date: Optional[date] = None, edition: Optional[st
             "importance": row["importance"] or 0.5
         })
 
-    return {
+    result = {
         "date": target_date.isoformat(),
         "edition": edition,
         "title": title,
         "count": len(headlines),
         "headlines": headlines
     }
+    _HEADLINE_CACHE[cache_key] = (time.monotonic() + _HEADLINE_CACHE_TTL, result)
+    return result
+
+
+def get_today_headlines_json(target_date: Optional[date] = None,
+                             edition: Optional[str] = None) -> bytes:
+    """UTF-8 JSON bytes form of get_today_headlines for HTTP responses.
+
+    The payload only changes when an edition is published, so the encoded
+    bytes are cached with the same TTL as the dict and handed back as-is
+    instead of re-serializing the same headlines on every request.
+    """
+    if target_date is None:
+        target_date = date.today()
+    if edition is None:
+        edition = _HOUR_TO_EDITION[datetime.now().hour]
+
+    cache_key = (target_date.isoformat(), edition)
+    cached = _HEADLINE_JSON_CACHE.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = get_today_headlines(target_date=target_date, edition=edition)
+    body = json.dumps(result, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+    _HEADLINE_JSON_CACHE[cache_key] = (time.monotonic() + _HEADLINE_CACHE_TTL, body)
+    return body
 
 
 def get_all_edition_headlines(target_date: Optional[date] = None) -> list[dict]:
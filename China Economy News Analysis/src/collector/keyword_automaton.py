@@ -0,0 +1,249 @@
+"""키워드 다중 패턴 매칭 모듈 (Aho-Corasick 기반).
+
+INDUSTRY_KEYWORDS + CONTENT_TYPE_KEYWORDS 전체(~60개)를 하나의 automaton으로
+묶어 기사당 한 번의 O(L) 스캔으로 분류한다. 기존의 키워드별 `in` 반복
+(O(키워드수 × 본문길이))을 대체하는 핫루프 최적화.
+"""
+
+import logging
+from collections import Counter
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from config.settings import (
+    INDUSTRY_KEYWORDS,
+    CONTENT_TYPE_KEYWORDS,
+    INDUSTRY_PATTERNS,
+    CONTENT_TYPE_PATTERNS,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+def _build_automaton():
+    """두 키워드 딕셔너리로부터 automaton을 1회 구성한다.
+
+    payload는 (bucket, category) 튜플:
+      - bucket: 'industry' 또는 'content_type'
+      - category: 해당 딕셔너리의 키 (예: 'semiconductor', 'policy')
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, keywords in INDUSTRY_KEYWORDS.items():
+        for kw in keywords:
+            automaton.add_word(kw, ("industry", category))
+    for category, keywords in CONTENT_TYPE_KEYWORDS.items():
+        for kw in keywords:
+            # 같은 키워드가 industry 쪽에 이미 있으면 industry가 우선
+            if not automaton.exists(kw):
+                automaton.add_word(kw, ("content_type", category))
+    automaton.make_automaton()
+    return automaton
+
+
+# 모듈 레벨 싱글턴 — 반복 크롤에서 재사용
+_AUTOMATON = _build_automaton()
+
+if _AUTOMATON is None:
+    logger.debug("pyahocorasick not installed; falling back to substring scan")
+
+
+def classify(text: str) -> dict:
+    """본문을 한 번 스캔하여 bucket별 카테고리 매칭 횟수를 집계한다.
+
+    Returns:
+        {'industry': Counter({category: hits}), 'content_type': Counter(...)}
+    """
+    result = {"industry": Counter(), "content_type": Counter()}
+    if not text:
+        return result
+
+    if _AUTOMATON is not None:
+        for _, (bucket, category) in _AUTOMATON.iter(text):
+            result[bucket][category] += 1
+        return result
+
+    # Fallback: pyahocorasick 미설치 환경용 — bucket당 1개의 컴파일된
+    # alternation 정규식으로 C 레벨 스캔 (동일한 결과)
+    for category, pattern in INDUSTRY_PATTERNS.items():
+        hits = len(pattern.findall(text))
+        if hits:
+            result["industry"][category] += hits
+    for category, pattern in CONTENT_TYPE_PATTERNS.items():
+        hits = len(pattern.findall(text))
+        if hits:
+            result["content_type"][category] += hits
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 비트마스크 분류 — (bucket, category)마다 고정 비트 하나를 배정해 기사당
+# 카테고리 집합을 int 하나로 표현한다. 집합 연산이 dict 없이 AND/OR +
+# int.bit_count()로 끝나므로 대량 집계 시 할당 비용이 사라진다.
+# ---------------------------------------------------------------------------
+
+CATEGORY_BITS = {
+    key: 1 << i
+    for i, key in enumerate(
+        [("industry", c) for c in INDUSTRY_KEYWORDS]
+        + [("content_type", c) for c in CONTENT_TYPE_KEYWORDS]
+    )
+}
+
+# industry 버킷 전체를 덮는 마스크 (has_industry_keyword의 비트 버전)
+INDUSTRY_MASK = 0
+for (_bucket, _cat), _bit in CATEGORY_BITS.items():
+    if _bucket == "industry":
+        INDUSTRY_MASK |= _bit
+del _bucket, _cat, _bit
+
+
+def classify_mask(text: str) -> int:
+    """본문을 한 번 스캔하여 매칭된 카테고리 집합을 비트마스크로 돌려준다.
+
+    비트 배치는 CATEGORY_BITS 참조. 매칭 횟수가 필요하면 classify()를,
+    집합 멤버십/교집합만 필요하면 이쪽이 빠르다.
+    예: (mask & INDUSTRY_MASK).bit_count() == 매칭된 industry 카테고리 수.
+    """
+    mask = 0
+    if not text:
+        return mask
+
+    if _AUTOMATON is not None:
+        for _, payload in _AUTOMATON.iter(text):
+            mask |= CATEGORY_BITS[payload]
+        return mask
+
+    for category, pattern in INDUSTRY_PATTERNS.items():
+        if pattern.search(text):
+            mask |= CATEGORY_BITS[("industry", category)]
+    for category, pattern in CONTENT_TYPE_PATTERNS.items():
+        if pattern.search(text):
+            mask |= CATEGORY_BITS[("content_type", category)]
+    return mask
+
+
+def mask_to_categories(mask: int) -> dict:
+    """비트마스크를 classify()와 같은 {bucket: set(category)} 형태로 되돌린다."""
+    result = {"industry": set(), "content_type": set()}
+    for (bucket, category), bit in CATEGORY_BITS.items():
+        if mask & bit:
+            result[bucket].add(category)
+    return result
+
+
+def has_industry_keyword(text: str) -> bool:
+    """INDUSTRY_KEYWORDS 중 하나라도 매칭되는지 (is_relevant_news Tier 1용)."""
+    if not text:
+        return False
+
+    if _AUTOMATON is not None:
+        for _, (bucket, _category) in _AUTOMATON.iter(text):
+            if bucket == "industry":
+                return True
+        return False
+
+    return any(pattern.search(text) for pattern in INDUSTRY_PATTERNS.values())
+
+# ---------------------------------------------------------------------------
+# is_relevant_news용 2단계 필터 키워드 — crawler에서 이동해 automaton으로 구성
+# ---------------------------------------------------------------------------
+
+# 제외: 사건사고/재난/사회/연예 기사 (제목 기준 즉시 거절)
+EXCLUDE_PATTERNS = [
+    "死亡", "遇难", "火灾", "地震", "洪水", "暴雨", "塌落", "坍塌",
+    "杀人", "犯罪", "被捕", "逮捕", "判刑", "判处", "刑事", "嫌疑人",
+    "车祸", "事故", "失联", "溺水", "坠楼",
+    "社保如何", "公积金如何", "如何办理", "如何领取",
+    "体育", "娱乐", "选秀", "综艺", "明星",
+]
+
+# Tier 1 — 강한 경제 키워드: 1개 매칭이면 관련 기사
+STRONG_KEYWORDS = [
+    "经济", "GDP", "产业", "金融", "财政", "货币", "利率",
+    "投资", "融资", "上市", "IPO", "股价", "债券", "基金",
+    "进出口", "贸易", "关税", "汇率", "外资", "外商",
+    "制造业", "工业增加值", "PMI", "CPI", "PPI",
+    "科创", "独角兽", "营收", "利润", "市值",
+    "房地产", "楼市", "土地出让", "保障房", "住房", "保租房",
+    "减税", "降费", "专项债", "财政赤字",
+]
+
+# Tier 2 — 약한 키워드: 서로 다른 2개 이상 매칭 필요
+WEAK_KEYWORDS = [
+    "发展", "市场", "企业", "公司", "政策", "规划",
+    "创新", "科技", "技术", "数字", "智能", "绿色",
+    "高质量", "改革", "工业", "制造",
+]
+
+
+def _build_word_automaton(words):
+    """키워드 리스트 하나를 automaton으로 구성한다 (payload = 키워드 자신)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_EXCLUDE_AUTOMATON = _build_word_automaton(EXCLUDE_PATTERNS)
+_STRONG_AUTOMATON = _build_word_automaton(STRONG_KEYWORDS)
+_WEAK_AUTOMATON = _build_word_automaton(WEAK_KEYWORDS)
+
+
+def matches_exclude(title: str) -> bool:
+    """제외 패턴(사건사고/연예 등)이 제목에 하나라도 있는지."""
+    if not title:
+        return False
+    if _EXCLUDE_AUTOMATON is not None:
+        for _ in _EXCLUDE_AUTOMATON.iter(title):
+            return True
+        return False
+    return any(pattern in title for pattern in EXCLUDE_PATTERNS)
+
+
+def has_strong_keyword(text: str) -> bool:
+    """강한 경제 키워드가 하나라도 매칭되는지 (Tier 1)."""
+    if not text:
+        return False
+    if _STRONG_AUTOMATON is not None:
+        for _ in _STRONG_AUTOMATON.iter(text):
+            return True
+        return False
+    return any(keyword in text for keyword in STRONG_KEYWORDS)
+
+
+def count_weak_keywords(text: str, limit: int = 2) -> int:
+    """서로 다른 약한 키워드 매칭 수를 센다 (limit 도달 시 조기 종료).
+
+    기존의 키워드별 `in` 집계와 동일하게 *고유* 키워드 수를 세며,
+    같은 키워드가 여러 번 나와도 1로 센다.
+    """
+    if not text:
+        return 0
+    if _WEAK_AUTOMATON is not None:
+        matched = set()
+        for _, word in _WEAK_AUTOMATON.iter(text):
+            matched.add(word)
+            if len(matched) >= limit:
+                break
+        return len(matched)
+    count = 0
+    for keyword in WEAK_KEYWORDS:
+        if keyword in text:
+            count += 1
+            if count >= limit:
+                break
+    return count
+
@@ -45,6 +45,12 @@ CORE_TOPIC_KEYWORDS = [
 # 중복 판정 임계값 (0.0 ~ 1.0, 높을수록 엄격)
 SIMILARITY_THRESHOLD = 0.4  # 낮춰서 더 많은 중복 감지
 
+# extract_title_keywords는 중복 판정에서 제목 쌍마다 호출되는 핫패스 —
+# 패턴을 모듈 로드 시 1회 컴파일해 둔다
+_ENGLISH_WORD_RE = re.compile(r'[A-Za-z]{2,}')
+_NUM_UNIT_RE = re.compile(r'\d+(?:\.\d+)?[亿万兆元%股点个家条项]?')
+_NON_CHINESE_RE = re.compile(r'[^\u4e00-\u9fff]')
+
 
 def extract_title_keywords(title: str) -> set:
     """제목에서 핵심 키워드 추출 (중복 판정용).
@@ -64,15 +70,15 @@ def extract_title_keywords(title: str) -> set:
             words.add(keyword)
 
     # 2. 영문 단어 추출 (대문자 변환)
-    english_words = re.findall(r'[A-Za-z]{2,}', title)
+    english_words = _ENGLISH_WORD_RE.findall(title)
     words.update(w.upper() for w in english_words)
 
     # 3. 숫자+단위 패턴 추출 (중요한 식별자)
-    num_patterns = re.findall(r'\d+(?:\.\d+)?[亿万兆元%股点个家条项]?', title)
+    num_patterns = _NUM_UNIT_RE.findall(title)
     words.update(p for p in num_patterns if len(p) >= 2)
 
     # 4. 중국어 2글자 키워드 추출 (핵심만)
-    chinese_text = re.sub(r'[^\u4e00-\u9fff]', '', title)
+    chinese_text = _NON_CHINESE_RE.sub('', title)
     for i in range(len(chinese_text) - 1):
         word = chinese_text[i:i+2]
         if word not in TITLE_STOPWORDS:
@@ -184,16 +190,24 @@ def load_processed_titles() -> list:
 # 내용적 점수 평가기 (모듈 레벨 싱글턴)
 _content_scorer = ContentScorer()
 
-EXCLUDED_KEYWORDS = ['论评', '专栏', '社论', '观点', '评论', '投稿', '广告', 'PR', '新闻稿', '赞助', '专题', '访谈', '座谈', '论坛', '活动', '开幕']
+# frozenset: 중복 제거를 보장하고, 아래 Aho-Corasick 오토마톤의 입력이 된다
+EXCLUDED_KEYWORDS = frozenset(['论评', '专栏', '社论', '观点', '评论', '投稿', '广告', 'PR', '新闻稿', '赞助', '专题', '访谈', '座谈', '论坛', '活动', '开幕'])
 DATA_PATTERNS = [r'\d+%', r'\d+亿', r'\d+万', r'\d+兆', r'\d+元', r'\d+\.\d+%']
-CONCRETE_KEYWORDS = ['发布', '公布', '统计', '数据', '报告', '政策', '措施', '方案', '规定', '条例', '增长', '下降', '上涨', '下跌', '同比', '环比']
+
+# 모듈 로드 시 1회 컴파일: 루프마다 re 내부 캐시를 문자열 키로 조회하지 않는다
+_DATA_PATTERN_RES = [re.compile(p) for p in DATA_PATTERNS]
+# '하나라도 매치' 판정용 융합 패턴 (6회 스캔 → 1회 스캔).
+# r'\d+\.\d+%'는 r'\d+%'에 포섭되므로 융합 시 제외 (점수 계산용
+# _DATA_PATTERN_RES는 패턴별 개수를 세므로 전체 목록 유지)
+_ANY_DATA_RE = re.compile(r'\d+%|\d+亿|\d+万|\d+兆|\d+元')
+CONCRETE_KEYWORDS = frozenset(['发布', '公布', '统计', '数据', '报告', '政策', '措施', '方案', '规定', '条例', '增长', '下降', '上涨', '下跌', '同比', '环比'])
 
 # 정부 행정 뉴스 제외 키워드
-GOVERNMENT_ADMIN_KEYWORDS = [
+GOVERNMENT_ADMIN_KEYWORDS = frozenset([
     '人事任免', '干部', '党委', '组织部', '纪委',
     '关于印发', '办公厅关于', '工作方案', '管理办法',
     '人民政府办公', '通知如下', '现印发给你们'
-]
+])
 
 # 단신 뉴스 제외 패턴 (기업 단순 발표, 외국 기업 뉴스)
 BRIEF_NEWS_PATTERNS = [
@@ -202,6 +216,7 @@ BRIEF_NEWS_PATTERNS = [
     r'.*：对公司.*产品售价.*调整',  # 기업 가격 조정 공지
     r'.*拟.*收购.*深交所问询',  # 단순 거래소 문의
 ]
+_BRIEF_NEWS_RES = [re.compile(p) for p in BRIEF_NEWS_PATTERNS]
 
 # 지방정부 출처
 LOCAL_GOV_SOURCES = ['beijing_gov', 'shanghai_gov', 'shenzhen_gov', 'bbtnews', 'sznews']
@@ -258,31 +273,134 @@ SOURCE_PRIORITY = {
 }
 
 # 사실 풍부도 관련 키워드
-FACT_RICH_KEYWORDS = [
+FACT_RICH_KEYWORDS = frozenset([
     '数据显示', '统计', '报告', '调查', '研究', '分析',
     '同比', '环比', '增长', '下降', '达到', '突破',
     '第一', '首次', '创新高', '创新低', '历史',
     '全国', '全球', '行业', '市场', '规模'
-]
+])
 
 # 범위 관련 키워드 (넓은 뉴스)
-BROAD_SCOPE_KEYWORDS = [
+BROAD_SCOPE_KEYWORDS = frozenset([
     '全国', '全球', '国际', '行业', '市场', '宏观',
     '政策', '战略', '规划', '改革', '转型'
-]
+])
 
 # 심층 분석 키워드
-DEEP_ANALYSIS_KEYWORDS = [
+DEEP_ANALYSIS_KEYWORDS = frozenset([
     '深度', '分析', '解读', '专访', '独家', '调研',
     '背后', '原因', '影响', '趋势', '展望'
-]
+])
+
+# 국내/해외 뉴스 판정 키워드 (is_domestic_news)
+FOREIGN_KEYWORDS = frozenset(['美国', '欧洲', '日本', '韩国', '东南亚', '国际'])
+DOMESTIC_KEYWORDS = frozenset(['中国', '国内', '本土', '央行', '发改委', '工信部'])
+
+
+# ============================================================
+# 점수 계산용 키워드 카운팅 커널 (C 구현 Aho-Corasick, 1패스)
+# ============================================================
+
+_SCORING_KEYWORD_GROUPS = {
+    'fact_rich': FACT_RICH_KEYWORDS,
+    'broad': BROAD_SCOPE_KEYWORDS,
+    'deep': DEEP_ANALYSIS_KEYWORDS,
+    'concrete': CONCRETE_KEYWORDS,
+}
+
+
+def _compile_automaton(payload_by_kw: dict):
+    """키워드→payload 매핑을 Aho-Corasick automaton으로 컴파일.
+
+    pyahocorasick 미설치 시 None을 돌려주고 호출부는 substring 루프로
+    폴백한다.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw, payload in payload_by_kw.items():
+        automaton.add_word(kw, payload)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_scoring_automaton():
+    """점수용 키워드 전체를 하나의 automaton으로 컴파일 (같은 키워드가
+    여러 그룹에 속할 수 있으므로 payload는 (키워드, 그룹 튜플))."""
+    groups_by_kw = {}
+    for group, keywords in _SCORING_KEYWORD_GROUPS.items():
+        for kw in keywords:
+            groups_by_kw.setdefault(kw, []).append(group)
+
+    return _compile_automaton(
+        {kw: (kw, tuple(groups)) for kw, groups in groups_by_kw.items()}
+    )
+
+
+_scoring_automaton = _build_scoring_automaton()
 
 
-def is_brief_news(title: str, content: str) -> bool:
+# 카테고리 이름 ↔ 정수 ID (categorize_news가 기사마다 문자열 대신
+# 정수 카운터만 다루도록)
+_CATEGORY_NAMES = list(CATEGORIES)
+
+
+def _build_category_automaton():
+    """카테고리 분류용 automaton (키워드가 여러 카테고리에 속할 수 있음).
+
+    payload는 (키워드 ID, 카테고리 ID 튜플): 매치 처리 루프가 문자열
+    해싱 없이 정수 set/리스트 연산만 수행한다.
+    """
+    cat_ids_by_kw = {}
+    for cat_id, keywords in enumerate(CATEGORIES.values()):
+        for kw in keywords:
+            cat_ids_by_kw.setdefault(kw, []).append(cat_id)
+
+    return _compile_automaton({
+        kw: (kw_id, tuple(cat_ids))
+        for kw_id, (kw, cat_ids) in enumerate(cat_ids_by_kw.items())
+    })
+
+
+# 판정용 automaton들: 기사당 수십 번의 substring 스캔을 각각 1패스로 대체
+_EXCLUDED_AC = _compile_automaton({kw: kw for kw in EXCLUDED_KEYWORDS})
+_GOV_ADMIN_AC = _compile_automaton({kw: kw for kw in GOVERNMENT_ADMIN_KEYWORDS})
+_CATEGORY_AC = _build_category_automaton()
+_DOMESTIC_AC = _compile_automaton(
+    {kw: (kw, 'foreign') for kw in FOREIGN_KEYWORDS}
+    | {kw: (kw, 'domestic') for kw in DOMESTIC_KEYWORDS}
+)
+
+
+def count_scoring_keywords(text: str) -> dict:
+    """텍스트 1회 스캔으로 그룹별 '출현한 키워드 개수'를 집계한다.
+
+    기존의 `sum(1 for kw in LIST if kw in text)` 반복과 동일한 의미
+    (출현 횟수가 아니라 출현한 키워드 수)를 유지한다.
+    """
+    if _scoring_automaton is not None:
+        matched = {group: set() for group in _SCORING_KEYWORD_GROUPS}
+        for _, (kw, groups) in _scoring_automaton.iter(text):
+            for group in groups:
+                matched[group].add(kw)
+        return {group: len(kws) for group, kws in matched.items()}
+
+    # Fallback: pyahocorasick 미설치 환경
+    return {
+        group: sum(1 for kw in keywords if kw in text)
+        for group, keywords in _SCORING_KEYWORD_GROUPS.items()
+    }
+
+
+def is_brief_news(title: str, content: str, combined: str = None) -> bool:
     """단신 뉴스 여부 판단"""
-    combined = title + content
-    for pattern in BRIEF_NEWS_PATTERNS:
-        if re.search(pattern, combined):
+    if combined is None:
+        combined = title + content
+    for pattern in _BRIEF_NEWS_RES:
+        if pattern.search(combined):
             return True
     # 제목이 너무 짧고 내용도 짧으면 단신
     if len(title) < 20 and len(content) < 100:
@@ -290,17 +408,18 @@ def is_brief_news(title: str, content: str) -> bool:
     return False
 
 
-def calculate_fact_richness(title: str, content: str) -> int:
+def calculate_fact_richness(title: str, content: str, combined: str = None) -> int:
     """사실 풍부도 점수 계산 (-10 ~ +20)"""
-    combined = title + content
+    if combined is None:
+        combined = title + content
     score = 0
 
     # 데이터 패턴 개수 (각 +3점)
-    data_count = sum(1 for p in DATA_PATTERNS if re.search(p, combined))
+    data_count = sum(1 for p in _DATA_PATTERN_RES if p.search(combined))
     score += min(data_count * 3, 12)  # 최대 12점
 
     # 사실 풍부 키워드 (각 +2점)
-    fact_count = sum(1 for kw in FACT_RICH_KEYWORDS if kw in combined)
+    fact_count = count_scoring_keywords(combined)['fact_rich']
     score += min(fact_count * 2, 8)  # 최대 8점
 
     # 내용 길이 보너스
@@ -318,16 +437,18 @@ def calculate_fact_richness(title: str, content: str) -> int:
     return score
 
 
-def calculate_scope_score(title: str, content: str) -> tuple:
+def calculate_scope_score(title: str, content: str, combined: str = None) -> tuple:
     """범위 점수 계산 (넓은 뉴스 vs 심층 뉴스)
     Returns: (scope_score, is_broad)
     - scope_score: 정렬용 점수 (넓은 뉴스가 높음)
     - is_broad: True면 넓은 뉴스, False면 심층 뉴스
     """
-    combined = title + content
+    if combined is None:
+        combined = title + content
 
-    broad_count = sum(1 for kw in BROAD_SCOPE_KEYWORDS if kw in combined)
-    deep_count = sum(1 for kw in DEEP_ANALYSIS_KEYWORDS if kw in combined)
+    counts = count_scoring_keywords(combined)
+    broad_count = counts['broad']
+    deep_count = counts['deep']
 
     # 넓은 뉴스면 높은 점수, 심층 뉴스면 낮은 점수 (정렬 시 넓은 것이 앞으로)
     if broad_count > deep_count:
@@ -338,50 +459,66 @@ def calculate_scope_score(title: str, content: str) -> tuple:
         return (7, True)  # 중립
 
 
-def is_factual_news(title: str, content: str, source: str = "") -> bool:
+def is_factual_news(title: str, content: str, source: str = "", combined: str = None) -> bool:
     """사실 뉴스인지 판단.
 
     중앙정부 출처(CENTRAL_GOV_SOURCES)는 행정 키워드 필터를 면제한다.
     정책 발표문이 '关于印发', '办公厅关于' 등의 패턴으로 필터링되는 것을 방지.
     """
-    combined = title + content
+    if combined is None:
+        combined = title + content
 
     # 논설/칼럼 제외 (모든 출처 동일)
-    if any(kw in combined for kw in EXCLUDED_KEYWORDS):
+    if _EXCLUDED_AC is not None:
+        if next(_EXCLUDED_AC.iter(combined), None) is not None:
+            return False
+    elif any(kw in combined for kw in EXCLUDED_KEYWORDS):
         return False
 
     # 정부 행정 공지 제외 — 중앙정부 출처는 면제
     if source not in CENTRAL_GOV_SOURCES:
-        if any(kw in combined for kw in GOVERNMENT_ADMIN_KEYWORDS):
+        if _GOV_ADMIN_AC is not None:
+            if next(_GOV_ADMIN_AC.iter(combined), None) is not None:
+                return False
+        elif any(kw in combined for kw in GOVERNMENT_ADMIN_KEYWORDS):
             return False
 
     return True
 
 
-def has_analytical_value(title: str, content: str, source: str = "") -> bool:
+def has_analytical_value(title: str, content: str, source: str = "", combined: str = None) -> bool:
     """분석 가치 판단.
 
     중앙정부 출처는 '印发+办公' 통지문 필터를 면제한다.
     """
-    combined = title + content
+    if combined is None:
+        combined = title + content
 
     # 정부 단순 통지문 제외 — 중앙정부 출처는 면제
     if source not in CENTRAL_GOV_SOURCES:
         if '印发' in title and '办公' in title:
             return False
 
-    if any(re.search(p, combined) for p in DATA_PATTERNS):
+    if _ANY_DATA_RE.search(combined):
         return True
-    if sum(1 for kw in CONCRETE_KEYWORDS if kw in combined) >= 2:
+    if count_scoring_keywords(combined)['concrete'] >= 2:
         return True
     return len(title) > 15
 
 
-def is_domestic_news(title: str, content: str) -> bool:
-    """중국 국내 뉴스 판단"""
-    combined = title + content
-    foreign = sum(1 for kw in ['美国', '欧洲', '日本', '韩国', '东南亚', '国际'] if kw in combined)
-    domestic = sum(1 for kw in ['中国', '国内', '本土', '央行', '发改委', '工信部'] if kw in combined)
+def is_domestic_news(title: str, content: str, combined: str = None) -> bool:
+    """중국 국내 뉴스 판단 (출현한 키워드 수 기준, 1패스 스캔)"""
+    if combined is None:
+        combined = title + content
+    if _DOMESTIC_AC is not None:
+        matched = {'foreign': set(), 'domestic': set()}
+        for _, (kw, group) in _DOMESTIC_AC.iter(combined):
+            matched[group].add(kw)
+        foreign = len(matched['foreign'])
+        domestic = len(matched['domestic'])
+    else:
+        foreign = sum(1 for kw in FOREIGN_KEYWORDS if kw in combined)
+        domestic = sum(1 for kw in DOMESTIC_KEYWORDS if kw in combined)
     return domestic > foreign or foreign <= 1
 
 
@@ -390,20 +527,38 @@ def is_local_gov_source(source: str) -> bool:
     return source in LOCAL_GOV_SOURCES
 
 
-def categorize_news(title: str, content: str) -> str:
-    """카테고리 분류"""
-    combined = title + content
+def categorize_news(title: str, content: str, combined: str = None) -> str:
+    """카테고리 분류 (카테고리×키워드 이중 루프 대신 1패스 스캔)"""
+    if combined is None:
+        combined = title + content
+    if _CATEGORY_AC is not None:
+        # 출현한 키워드(중복 제거)당 소속 카테고리 카운터를 +1 —
+        # 기존 `kw in combined` 루프와 동일한 의미를 정수 연산만으로 집계
+        scores = [0] * len(_CATEGORY_NAMES)
+        seen_kw_ids = set()
+        for _, (kw_id, cat_ids) in _CATEGORY_AC.iter(combined):
+            if kw_id in seen_kw_ids:
+                continue
+            seen_kw_ids.add(kw_id)
+            for cat_id in cat_ids:
+                scores[cat_id] += 1
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return _CATEGORY_NAMES[best]
+
     scores = defaultdict(int)
     for category, keywords in CATEGORIES.items():
         scores[category] = sum(1 for kw in keywords if kw in combined)
     return max(scores.items(), key=lambda x: x[1])[0] if scores else '기타'
 
 
-def filter_news(news_list: list, enable_dedup: bool = True) -> list:
+def filter_news(news_list, enable_dedup: bool = True) -> list:
     """뉴스 필터링 (중복 제거 포함).
 
+    제목+본문 결합 문자열은 건당 1회만 생성해 판정/점수 함수 전체가
+    combined 인자로 공유한다 (건당 문자열 복사 6회 → 1회).
+
     Args:
-        news_list: 필터링할 뉴스 리스트
+        news_list: 필터링할 뉴스 iterable (리스트 또는 제너레이터 스트림)
         enable_dedup: 중복 제거 활성화 여부 (기본: True)
     """
     filtered = []
@@ -426,13 +581,16 @@ def filter_news(news_list: list, enable_dedup: bool = True) -> list:
         if not content.strip():
             continue
 
-        if not is_factual_news(title, content, source):
+        # 제목+본문 결합 문자열은 모든 판정/점수 함수가 공유 (건당 1회 생성)
+        combined = title + content
+
+        if not is_factual_news(title, content, source, combined=combined):
             continue
-        if not has_analytical_value(title, content, source):
+        if not has_analytical_value(title, content, source, combined=combined):
             continue
 
         # 단신 뉴스 제외
-        if is_brief_news(title, content):
+        if is_brief_news(title, content, combined=combined):
             continue
 
         # === 중복 제거 ===
@@ -454,16 +612,16 @@ def filter_news(news_list: list, enable_dedup: bool = True) -> list:
             # 배치에 현재 제목 추가
             batch_titles.append(title)
 
-        news['category'] = categorize_news(title, content)
-        news['is_domestic'] = is_domestic_news(title, content)
+        news['category'] = categorize_news(title, content, combined=combined)
+        news['is_domestic'] = is_domestic_news(title, content, combined=combined)
         news['is_local_gov'] = is_local_gov_source(source)
 
         # 사실 풍부도 점수
-        fact_score = calculate_fact_richness(title, content)
+        fact_score = calculate_fact_richness(title, content, combined=combined)
         news['fact_richness'] = fact_score
 
         # 범위 점수 (넓은 vs 심층)
-        scope_score, is_broad = calculate_scope_score(title, content)
+        scope_score, is_broad = calculate_scope_score(title, content, combined=combined)
         news['scope_score'] = scope_score
         news['is_broad'] = is_broad
 
@@ -531,7 +689,7 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
     # 1단계: 각 카테고리에서 1개씩 (출처 중복 최소화, 지방정부 제한)
     for category in main_categories:
         if by_category[category]:
-            for news in by_category[category]:
+            for idx, news in enumerate(by_category[category]):
                 source = news.get('source', '')
                 is_local = news.get('is_local_gov', False)
 
@@ -549,7 +707,9 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
                     by_source[source] = by_source.get(source, 0) + 1
                     if is_local:
                         local_gov_count += 1
-                    by_category[category].remove(news)
+                    # remove(news)는 dict 동등성 비교로 O(N) 재탐색 —
+                    # 이미 아는 위치를 pop
+                    by_category[category].pop(idx)
                     break
 
             if len(selected) >= target_count:
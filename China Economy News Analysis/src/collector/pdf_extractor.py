@@ -4,9 +4,9 @@
 이 모듈은 PDF URL에서 텍스트를 추출하고, HTML 페이지에서 PDF 링크를 탐지한다.
 """
 
-import io
 import logging
 import re
+import tempfile
 from typing import Optional
 from urllib.parse import urljoin
 
@@ -18,13 +18,18 @@ MAX_PDF_PAGES = 20
 MAX_PDF_CHARS = 15000
 PDF_DOWNLOAD_TIMEOUT = 30
 
+# href에서 .pdf 링크 탐색 (모듈 로드 시 1회 컴파일)
+_PDF_HREF_RE = re.compile(r'href=["\']([^"\']*\.pdf)["\']', re.IGNORECASE)
 
-def extract_pdf_text(url: str, headers: dict = None) -> Optional[str]:
+
+def extract_pdf_text(url: str, headers: dict = None, session=None) -> Optional[str]:
     """URL에서 PDF를 다운로드하여 텍스트를 추출한다.
 
     Args:
         url: PDF 파일 URL
         headers: HTTP 요청 헤더 (선택)
+        session: 재사용할 requests.Session (선택). 같은 gov.cn 호스트에서
+            PDF를 여러 건 내려받을 때 TLS 핸드셰이크를 반복하지 않는다.
 
     Returns:
         추출된 텍스트 문자열, 실패 시 None
@@ -35,15 +40,25 @@ def extract_pdf_text(url: str, headers: dict = None) -> Optional[str]:
         logger.warning("pdfplumber not installed. Run: pip install pdfplumber")
         return None
 
+    http = session if session is not None else requests
     try:
-        response = requests.get(url, headers=headers, timeout=PDF_DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
-
-        if "application/pdf" not in response.headers.get("Content-Type", "") and not url.endswith(".pdf"):
-            logger.debug(f"Not a PDF: {url}")
-            return None
+        # 스트리밍 다운로드: Content-Type 거부는 본문 수신 전에 일어나고,
+        # 대형 문건도 8MB까지만 메모리에 머물다 디스크로 흘러넘친다
+        response = http.get(url, headers=headers, timeout=PDF_DOWNLOAD_TIMEOUT, stream=True)
+        try:
+            response.raise_for_status()
+
+            if "application/pdf" not in response.headers.get("Content-Type", "") and not url.endswith(".pdf"):
+                logger.debug(f"Not a PDF: {url}")
+                return None
+
+            pdf_bytes = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+            for chunk in response.iter_content(65536):
+                pdf_bytes.write(chunk)
+            pdf_bytes.seek(0)
+        finally:
+            response.close()
 
-        pdf_bytes = io.BytesIO(response.content)
         text_parts = []
 
         with pdfplumber.open(pdf_bytes) as pdf:
@@ -86,9 +101,7 @@ def find_pdf_links(html: str, base_url: str) -> list[str]:
     """
     pdf_urls = []
 
-    # href에서 .pdf 링크 탐색
-    pattern = re.compile(r'href=["\']([^"\']*\.pdf)["\']', re.IGNORECASE)
-    for match in pattern.finditer(html):
+    for match in _PDF_HREF_RE.finditer(html):
         pdf_path = match.group(1)
         if not pdf_path.startswith("http"):
             pdf_path = urljoin(base_url, pdf_path)
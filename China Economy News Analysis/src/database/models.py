@@ -1,6 +1,7 @@
 """Database models and initialization."""
 
 import sqlite3
+import threading
 from pathlib import Path
 import sys
 
@@ -8,18 +9,77 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from config.settings import DATABASE_PATH
 
 
-def get_connection() -> sqlite3.Connection:
-    """Get database connection."""
-    conn = sqlite3.connect(DATABASE_PATH)
+# WAL is persistent in the database file; only switch it once per process.
+_wal_enabled = False
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply performance pragmas to a connection.
+
+    WAL lets readers (web/dashboard) proceed while the selector/crawler
+    writes; synchronous=NORMAL is safe under WAL and skips one fsync per
+    commit; mmap/temp_store/cache tuning speeds up the read-heavy feed
+    queries.
+    """
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    conn.executescript(
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-20000;"
+    )
+    return conn
+
+
+def get_connection(check_same_thread: bool = True) -> sqlite3.Connection:
+    """Get database connection.
+
+    check_same_thread=False is for pooled read-only connections that are
+    handed between threads; the pool serializes access to each one.
+    """
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    return configure_connection(conn)
+
+
+_thread_local = threading.local()
+
+
+def get_thread_connection() -> sqlite3.Connection:
+    """Get a persistent per-thread connection.
+
+    For short helper calls (bookmarks, tags, headlines) the connect/close
+    cycle dominates the query itself; callers of this variant share one
+    connection per thread and never close it — its lifetime is the
+    thread's. Under WAL these long-lived readers don't block the writer.
+    """
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = _thread_local.conn = get_connection()
     return conn
 
 
+# Bump when init_db's schema changes; stored in SQLite's user_version pragma
+SCHEMA_VERSION = 4
+
+
 def init_db():
-    """Initialize database with schema."""
+    """Initialize database with schema.
+
+    Idempotent and cheap to call unconditionally: the schema DDL is skipped
+    when the database's user_version pragma already matches SCHEMA_VERSION.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
+    current_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    if current_version >= SCHEMA_VERSION:
+        conn.close()
+        return
+
     # News table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS news (
@@ -52,11 +112,49 @@ def init_db():
             score_explanation TEXT,
             card_headline VARCHAR(36),
             edition TEXT,
+            content_length INTEGER DEFAULT 0,
+            fetch_attempts INTEGER DEFAULT 0,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
     """)
 
+    # content_length is denormalized from original_content so feed queries
+    # can filter on an indexed integer instead of TRIM'ing every row.
+    # (ALTER covers databases created before the column existed.)
+    cursor.execute("PRAGMA table_info(news)")
+    existing_columns = [col[1] for col in cursor.fetchall()]
+    if 'content_length' not in existing_columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN content_length INTEGER DEFAULT 0")
+    # fetch_attempts counts failed content fetches so enrichment stops
+    # retrying permanently broken URLs (ALTER covers pre-v4 databases)
+    if 'fetch_attempts' not in existing_columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN fetch_attempts INTEGER DEFAULT 0")
+    cursor.execute("""
+        UPDATE news SET content_length = LENGTH(TRIM(COALESCE(original_content, '')))
+        WHERE content_length != LENGTH(TRIM(COALESCE(original_content, '')))
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_news_content_len_ins
+        AFTER INSERT ON news
+        FOR EACH ROW
+        BEGIN
+            UPDATE news
+            SET content_length = LENGTH(TRIM(COALESCE(NEW.original_content, '')))
+            WHERE id = NEW.id;
+        END;
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_news_content_len_upd
+        AFTER UPDATE OF original_content ON news
+        FOR EACH ROW
+        BEGIN
+            UPDATE news
+            SET content_length = LENGTH(TRIM(COALESCE(NEW.original_content, '')))
+            WHERE id = NEW.id;
+        END;
+    """)
+
     # Expert reviews table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS expert_reviews (
@@ -113,6 +211,17 @@ def init_db():
                ('notify_on_opinion_conflict', 'true')
     """)
 
+    # HTTP validator cache for conditional GETs (crawler sends
+    # If-None-Match / If-Modified-Since; a 304 skips download and parse)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS url_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
     # Indexes
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_importance ON news(importance_score DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_industry ON news(industry_category)")
@@ -123,6 +232,45 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_completed ON expert_reviews(review_completed_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_publish_status ON expert_reviews(publish_status)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_content_score ON news(content_score DESC)")
+    # Partial index for the edition-selection candidate query: ranged lookup
+    # on published_at over the small not-yet-queued subset instead of a scan
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_queue_window ON news(published_at)
+        WHERE analyzed_at IS NOT NULL
+          AND edition IS NULL
+          AND (expert_review_status IS NULL OR expert_review_status = 'none')
+          AND importance_score <= 1.0
+    """)
+    # Covering indexes for the public feed join (news ⋈ expert_reviews on
+    # published, commented reviews with non-empty content)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_er_published ON expert_reviews(news_id)
+        WHERE publish_status = 'published' AND expert_comment IS NOT NULL
+    """)
+    cursor.execute("DROP INDEX IF EXISTS idx_news_feed")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_feed ON news(published_at DESC)
+        WHERE content_length > 0
+    """)
+    # Partial index for enrich_news_content's candidate scan: the contentless,
+    # not-yet-given-up subset ordered by collection time
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_enrich ON news(collected_at DESC)
+        WHERE (original_content IS NULL OR original_content = '')
+          AND fetch_attempts < 3
+    """)
+    # Bookmark list and unread-notification queries: partial indexes over
+    # the small flagged subsets, pre-sorted in each query's ORDER BY
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_bookmarked_recent ON news(updated_at DESC)
+        WHERE is_bookmarked = TRUE
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(created_at DESC)
+        WHERE is_read = FALSE
+    """)
+
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     conn.commit()
     conn.close()
@@ -190,6 +338,19 @@ def migrate_db():
         cursor.execute("ALTER TABLE news ADD COLUMN edition TEXT")
         print("Added edition column to news table")
 
+    # Denormalized content length maintained by triggers (feed WHERE clause)
+    if 'content_length' not in columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN content_length INTEGER DEFAULT 0")
+        cursor.execute(
+            "UPDATE news SET content_length = LENGTH(TRIM(COALESCE(original_content, '')))"
+        )
+        print("Added content_length column to news table (backfilled)")
+
+    # Failed-fetch counter so enrichment skips repeatedly broken URLs
+    if 'fetch_attempts' not in columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN fetch_attempts INTEGER DEFAULT 0")
+        print("Added fetch_attempts column to news table")
+
     # Create notifications tables if not exist
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS notifications (
@@ -222,6 +383,16 @@ def migrate_db():
                ('notify_on_opinion_conflict', 'true')
     """)
 
+    # HTTP validator cache for crawler conditional GETs
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS url_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
     # Publish status columns for expert_reviews
     cursor.execute("PRAGMA table_info(expert_reviews)")
     er_columns = [col[1] for col in cursor.fetchall()]
@@ -247,6 +418,55 @@ def migrate_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications(created_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_expert_review_status ON news(expert_review_status)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_edition ON news(edition)")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_queue_window ON news(published_at)
+        WHERE analyzed_at IS NOT NULL
+          AND edition IS NULL
+          AND (expert_review_status IS NULL OR expert_review_status = 'none')
+          AND importance_score <= 1.0
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_er_published ON expert_reviews(news_id)
+        WHERE publish_status = 'published' AND expert_comment IS NOT NULL
+    """)
+    cursor.execute("DROP INDEX IF EXISTS idx_news_feed")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_feed ON news(published_at DESC)
+        WHERE content_length > 0
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_enrich ON news(collected_at DESC)
+        WHERE (original_content IS NULL OR original_content = '')
+          AND fetch_attempts < 3
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_news_bookmarked_recent ON news(updated_at DESC)
+        WHERE is_bookmarked = TRUE
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(created_at DESC)
+        WHERE is_read = FALSE
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_news_content_len_ins
+        AFTER INSERT ON news
+        FOR EACH ROW
+        BEGIN
+            UPDATE news
+            SET content_length = LENGTH(TRIM(COALESCE(NEW.original_content, '')))
+            WHERE id = NEW.id;
+        END;
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_news_content_len_upd
+        AFTER UPDATE OF original_content ON news
+        FOR EACH ROW
+        BEGIN
+            UPDATE news
+            SET content_length = LENGTH(TRIM(COALESCE(NEW.original_content, '')))
+            WHERE id = NEW.id;
+        END;
+    """)
 
     # Trigger: block expert_reviews insert unless news is queued_today
     cursor.execute("""
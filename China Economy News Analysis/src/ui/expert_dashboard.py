@@ -208,6 +208,10 @@ def save_expert_comment(news_id: int, comment: str) -> bool:
     if success:
         _auto_generate_headline(news_id)
 
+        # Published set may have changed — drop cached feed results
+        from src.api.public_feed import invalidate_feed_cache
+        invalidate_feed_cache()
+
     return success
 
 
@@ -338,13 +342,20 @@ def update_publish_status(news_id: int, new_status: str, admin_note: str = None)
             WHERE news_id = ?
         """, (new_status, admin_note, now, now, news_id))
         conn.commit()
-        return cursor.rowcount > 0
+        updated = cursor.rowcount > 0
     except Exception as e:
         st.error(f"상태 변경 실패: {e}")
         return False
     finally:
         conn.close()
 
+    if updated:
+        # Published set may have changed — drop cached feed results
+        from src.api.public_feed import invalidate_feed_cache
+        invalidate_feed_cache()
+
+    return updated
+
 
 def bulk_update_publish_status(news_ids: list, new_status: str) -> int:
     """Bulk update publish_status for multiple reviews."""
@@ -363,13 +374,20 @@ def bulk_update_publish_status(news_ids: list, new_status: str) -> int:
             WHERE news_id IN ({placeholders})
         """, [new_status, now, now] + list(news_ids))
         conn.commit()
-        return cursor.rowcount
+        updated = cursor.rowcount
     except Exception as e:
         st.error(f"일괄 상태 변경 실패: {e}")
         return 0
     finally:
         conn.close()
 
+    if updated:
+        # Published set may have changed — drop cached feed results
+        from src.api.public_feed import invalidate_feed_cache
+        invalidate_feed_cache()
+
+    return updated
+
 
 def generate_ai_final_review(news_id: int) -> str:
     """Generate AI final review comparing expert and AI opinions."""
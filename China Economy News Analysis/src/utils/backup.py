@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Database backup utility."""
 
+import os
 import shutil
 import gzip
 from datetime import datetime
@@ -31,9 +32,12 @@ def create_backup(compress: bool = True) -> Path:
         backup_filename = f"news_backup_{timestamp}.db.gz"
         backup_path = backup_dir / backup_filename
 
+        # compresslevel=1: SQLite pages compress well even at the lowest
+        # level, and DEFLATE CPU drops several-fold vs the default 9.
+        # 1 MiB copy buffer halves the syscall count vs the 16 KiB default.
         with open(db_path, 'rb') as f_in:
-            with gzip.open(backup_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            with gzip.open(backup_path, 'wb', compresslevel=1) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
     else:
         backup_filename = f"news_backup_{timestamp}.db"
         backup_path = backup_dir / backup_filename
@@ -68,7 +72,7 @@ def restore_backup(backup_path: str) -> bool:
     if backup_file.suffix == '.gz':
         with gzip.open(backup_file, 'rb') as f_in:
             with open(db_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
     else:
         shutil.copy2(backup_file, db_path)
 
@@ -92,11 +96,16 @@ def cleanup_old_backups(keep_days: int = 7) -> int:
     cutoff = datetime.now().timestamp() - (keep_days * 24 * 60 * 60)
     deleted = 0
 
-    for backup_file in backup_dir.glob("news_backup_*"):
-        if backup_file.stat().st_mtime < cutoff:
-            backup_file.unlink()
-            print(f"Deleted old backup: {backup_file.name}")
-            deleted += 1
+    # os.scandir: name and stat come from the directory read (DirEntry
+    # caches the stat result), vs two syscalls per file with Path.stat()
+    with os.scandir(backup_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith("news_backup_"):
+                continue
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                print(f"Deleted old backup: {entry.name}")
+                deleted += 1
 
     return deleted
 
@@ -111,12 +120,17 @@ def list_backups() -> list[dict]:
     if not backup_dir.exists():
         return []
 
+    with os.scandir(backup_dir) as entries:
+        matched = [e for e in entries if e.name.startswith("news_backup_")]
+
     backups = []
-    for backup_file in sorted(backup_dir.glob("news_backup_*"), reverse=True):
-        stat = backup_file.stat()
+    # Newest first; filenames embed the timestamp so name order and mtime
+    # order agree, and DirEntry.stat() is cached for the reuse below
+    for entry in sorted(matched, key=lambda e: e.stat().st_mtime, reverse=True):
+        stat = entry.stat()
         backups.append({
-            "filename": backup_file.name,
-            "path": str(backup_file),
+            "filename": entry.name,
+            "path": entry.path,
             "size_mb": round(stat.st_size / (1024 * 1024), 2),
             "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
         })
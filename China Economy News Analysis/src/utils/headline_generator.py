@@ -4,13 +4,18 @@ Generates attention-grabbing headlines (max 18 Korean characters)
 from original news titles using Claude API.
 """
 
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import anthropic
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL
-from src.database.models import get_connection
+from src.database.models import get_connection, get_thread_connection
 
 # Maximum characters for card headline (Korean)
 # 18자: 모바일 375px 1위 헤드라인 한 줄 표시 기준
@@ -22,6 +27,27 @@ FORBIDDEN_PHRASES = [
     "에 따르면", "관련", "에 대한", "대해", "위한",
     "주목", "관심", "이슈", "화제", "논란",
 ]
+# One alternation sub instead of a replace() pass per phrase
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, FORBIDDEN_PHRASES)))
+
+# The Anthropic client keeps an HTTP connection pool; constructing it per
+# headline throws away keep-alive connections between calls.
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> anthropic.Anthropic:
+    global _client
+    if _client is None:
+        # Lock: generate_headlines_concurrent fans out over threads, and
+        # racing initializers would each build (and leak) a TLS pool.
+        with _client_lock:
+            if _client is None:
+                # max_retries: transient 429/5xx handled by SDK-side
+                # exponential backoff; the length-retry loop below is
+                # about output length only
+                _client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=2)
+    return _client
 
 HEADLINE_PROMPT = """역할: 당신은 숙련된 뉴스 데스크 편집자다.
 목표: 독자가 헤드라인만 보고도 기사 핵심 내용을 70% 이상 추측할 수 있게 한다.
@@ -61,6 +87,28 @@ HEADLINE_PROMPT = """역할: 당신은 숙련된 뉴스 데스크 편집자다.
 18자 이내 헤드라인만 출력. 따옴표, 설명, 글자수 표기 없이 헤드라인만."""
 
 
+BATCH_HEADLINE_PROMPT = """역할: 당신은 숙련된 뉴스 데스크 편집자다.
+목표: 아래 원본 제목 각각에 대해 18자 이내 헤드라인을 작성한다.
+
+## 핵심 규칙 (반드시 준수)
+
+★★★ 글자 수: 반드시 18자 이내 (공백 포함, 절대 초과 금지) ★★★
+
+1. "사실 + 대상 + 결과" 구조로 작성
+2. 숫자, 고유명사, 행위 주체 포함
+3. 추상적 표현 금지 ('논란', '파장', '관심', '주목' 사용 금지)
+4. 제목만 읽어도 "무슨 일이 있었는지" 명확해야 함
+
+## 입력 (원본 제목 {count}건)
+
+{titles}
+
+## 출력
+
+정확히 {count}개의 헤드라인을 JSON 배열로만 출력.
+입력 순서와 동일한 순서, 설명이나 코드 블록 없이 JSON 배열만."""
+
+
 RETRY_PROMPT = """이전 헤드라인이 18자를 초과했습니다.
 
 이전 시도: "{previous}" ({length}자)
@@ -89,12 +137,16 @@ def generate_headline(title: str) -> str:
         return _fallback_headline(title)
 
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        client = _get_client()
 
-        # First attempt
+        # First attempt. Low temperature and a newline stop sequence bound
+        # output length model-side, cutting how often the 18-char retry
+        # loop fires at all.
         response = client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=100,
+            temperature=0.2,
+            stop_sequences=["\n"],
             messages=[
                 {
                     "role": "user",
@@ -142,14 +194,136 @@ def generate_headline(title: str) -> str:
         return _fallback_headline(title)
 
 
+def generate_headlines_batch(titles: list[str], batch_size: int = 10) -> list[str]:
+    """Generate headlines for many titles with batched API calls.
+
+    One request covers up to batch_size titles, amortizing the network
+    round trip; only entries that come back over 18 characters pay for
+    an item-level retry.
+
+    Args:
+        titles: Original translated news titles
+        batch_size: Titles per API request
+
+    Returns:
+        Headlines in the same order as titles
+    """
+    if not ANTHROPIC_API_KEY:
+        return [_fallback_headline(t) for t in titles]
+
+    headlines: list[str] = []
+    client = _get_client()
+
+    for start in range(0, len(titles), batch_size):
+        batch = titles[start:start + batch_size]
+        try:
+            numbered = "\n".join(f"{i + 1}. {t}" for i, t in enumerate(batch))
+            response = client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=100 * len(batch),
+                temperature=0.2,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": BATCH_HEADLINE_PROMPT.format(
+                            count=len(batch), titles=numbered
+                        )
+                    }
+                ]
+            )
+
+            raw = response.content[0].text.strip()
+            if raw.startswith("```"):
+                raw = raw.strip("`").lstrip("json").strip()
+            parsed = json.loads(raw)
+            if not isinstance(parsed, list) or len(parsed) != len(batch):
+                raise ValueError(f"expected {len(batch)} headlines, got {parsed!r:.80}")
+
+            # Accumulate locally and extend only on success: a mid-batch
+            # failure must never leave a partial batch in headlines, or
+            # every later headline lands on the wrong news item.
+            batch_out = []
+            for title, headline in zip(batch, parsed):
+                headline = _clean_headline(str(headline))
+                if len(headline) > MAX_HEADLINE_LENGTH:
+                    try:
+                        headline = _retry_headline(client, title, headline)
+                    except Exception as e:
+                        print(f"Headline retry error: {e}")
+                        headline = _fallback_headline(title)
+                batch_out.append(headline)
+            headlines.extend(batch_out)
+
+        except Exception as e:
+            print(f"Batch headline generation error: {e}")
+            headlines.extend(_fallback_headline(t) for t in batch)
+
+    return headlines
+
+
+def generate_headlines_concurrent(titles: list[str], max_workers: int = 8) -> list[str]:
+    """Generate one headline per title with overlapped API calls.
+
+    Unlike generate_headlines_batch (one prompt covering many titles),
+    each title gets its own request — full per-item retry behavior — but
+    the round trips run concurrently, so wall time is ~1 RTT per
+    max_workers titles instead of one RTT per title. The anthropic
+    client is thread-safe and shares its connection pool across workers.
+
+    Args:
+        titles: Original translated news titles
+        max_workers: Concurrent in-flight requests
+
+    Returns:
+        Headlines in the same order as titles
+    """
+    if not ANTHROPIC_API_KEY:
+        return [_fallback_headline(t) for t in titles]
+    if not titles:
+        return []
+
+    _get_client()  # initialize once before the fan-out
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(titles))) as executor:
+        return list(executor.map(generate_headline, titles))
+
+
+def _retry_headline(client: anthropic.Anthropic, title: str, headline: str) -> str:
+    """Re-ask for a shorter headline; truncate if retries still exceed."""
+    retry_count = 0
+    while len(headline) > MAX_HEADLINE_LENGTH and retry_count < MAX_RETRY_COUNT:
+        retry_count += 1
+        print(f"  ↻ 재시도 {retry_count}: {headline} ({len(headline)}자 > 18자)")
+
+        response = client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=100,
+            messages=[
+                {
+                    "role": "user",
+                    "content": RETRY_PROMPT.format(
+                        previous=headline,
+                        length=len(headline),
+                        title=title
+                    )
+                }
+            ]
+        )
+        headline = _clean_headline(response.content[0].text.strip())
+
+    if len(headline) > MAX_HEADLINE_LENGTH:
+        print(f"  ⚠ 강제 축약: {headline} ({len(headline)}자)")
+        headline = headline[:MAX_HEADLINE_LENGTH-1] + "…"
+
+    return headline
+
+
 def _clean_headline(headline: str) -> str:
     """Clean and validate the generated headline."""
     # Remove quotes if wrapped
     headline = headline.strip('"\'')
 
     # Remove forbidden phrases
-    for phrase in FORBIDDEN_PHRASES:
-        headline = headline.replace(phrase, "")
+    headline = _FORBIDDEN_RE.sub("", headline)
 
     # Clean up whitespace
     headline = " ".join(headline.split())
@@ -185,17 +359,13 @@ def save_headline(news_id: int, headline: str) -> bool:
         True if successful
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = get_thread_connection()
+        conn.execute("""
             UPDATE news
             SET card_headline = ?, updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         """, (headline, news_id))
-
         conn.commit()
-        conn.close()
         return True
 
     except Exception as e:
@@ -212,12 +382,9 @@ def get_headline(news_id: int) -> str | None:
     Returns:
         Card headline or None if not set
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
+    cursor = get_thread_connection().cursor()
     cursor.execute("SELECT card_headline FROM news WHERE id = ?", (news_id,))
     row = cursor.fetchone()
-    conn.close()
 
     return row['card_headline'] if row else None
 
@@ -235,3 +402,29 @@ def generate_and_save_headline(news_id: int, title: str) -> str:
     headline = generate_headline(title)
     save_headline(news_id, headline)
     return headline
+
+
+def generate_and_save_headlines_batch(rows: list[tuple[int, str]]) -> list[str]:
+    """Generate and save headlines for many news items at once.
+
+    Args:
+        rows: (news_id, original translated title) pairs
+
+    Returns:
+        Generated headlines, in the same order as rows
+    """
+    if not rows:
+        return []
+
+    headlines = generate_headlines_batch([title for _, title in rows])
+
+    conn = get_connection()
+    conn.executemany("""
+        UPDATE news
+        SET card_headline = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """, [(headline, news_id) for (news_id, _), headline in zip(rows, headlines)])
+    conn.commit()
+    conn.close()
+
+    return headlines
@@ -1,12 +1,17 @@
 """Notification utilities for important news alerts."""
 
+import queue
+from contextlib import contextmanager
 from datetime import datetime
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from src.database.models import get_connection
+from src.database.models import get_connection, get_thread_connection
+
+# Read-only connections kept for list queries (see _acquire_reader)
+_READ_POOL_SIZE = 4
 
 
 class NotificationManager:
@@ -14,6 +19,13 @@ class NotificationManager:
 
     def __init__(self):
         self.conn = None
+        # Settings cache: one SELECT on first access instead of a query
+        # per get_setting call; set_setting keeps it in sync.
+        self._settings_cache: dict | None = None
+        # Bounded pool of read-only connections so concurrent UI
+        # refreshes don't serialize on the single writer connection.
+        # Connections are created on demand, up to the pool bound.
+        self._read_pool: queue.Queue = queue.Queue(maxsize=_READ_POOL_SIZE)
 
     def _get_conn(self):
         if not self.conn:
@@ -25,16 +37,39 @@ class NotificationManager:
             self.conn.close()
             self.conn = None
 
+    @contextmanager
+    def _acquire_reader(self):
+        """Borrow a read-only connection from the pool.
+
+        query_only makes misuse fail loudly; WAL (set in
+        configure_connection) lets these readers run while the writer
+        connection commits. Overflow connections are closed on release
+        instead of growing the pool.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = get_connection(check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+        try:
+            yield conn
+        finally:
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _load_settings(self) -> dict:
+        """Load all notification settings in one query."""
+        if self._settings_cache is None:
+            cursor = self._get_conn().cursor()
+            cursor.execute("SELECT setting_key, setting_value FROM notification_settings")
+            self._settings_cache = {row[0]: row[1] for row in cursor.fetchall()}
+        return self._settings_cache
+
     def get_setting(self, key: str, default: str = None) -> str:
         """Get notification setting value."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT setting_value FROM notification_settings WHERE setting_key = ?",
-            (key,)
-        )
-        row = cursor.fetchone()
-        return row[0] if row else default
+        return self._load_settings().get(key, default)
 
     def set_setting(self, key: str, value: str) -> bool:
         """Update notification setting."""
@@ -49,6 +84,8 @@ class NotificationManager:
                     updated_at = excluded.updated_at
             """, (key, value, datetime.now()))
             conn.commit()
+            if self._settings_cache is not None:
+                self._settings_cache[key] = value
             return True
         except Exception as e:
             print(f"Error updating setting: {e}")
@@ -119,30 +156,30 @@ class NotificationManager:
 
     def get_unread_notifications(self, limit: int = 20) -> list:
         """Get unread notifications."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT n.*, news.translated_title, news.original_title
-            FROM notifications n
-            LEFT JOIN news ON n.news_id = news.id
-            WHERE n.is_read = FALSE
-            ORDER BY n.created_at DESC
-            LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        with self._acquire_reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT n.*, news.translated_title, news.original_title
+                FROM notifications n
+                LEFT JOIN news ON n.news_id = news.id
+                WHERE n.is_read = FALSE
+                ORDER BY n.created_at DESC
+                LIMIT ?
+            """, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_all_notifications(self, limit: int = 50) -> list:
         """Get all notifications."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT n.*, news.translated_title, news.original_title
-            FROM notifications n
-            LEFT JOIN news ON n.news_id = news.id
-            ORDER BY n.created_at DESC
-            LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        with self._acquire_reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT n.*, news.translated_title, news.original_title
+                FROM notifications n
+                LEFT JOIN news ON n.news_id = news.id
+                ORDER BY n.created_at DESC
+                LIMIT ?
+            """, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
 
     def mark_as_read(self, notification_id: int) -> bool:
         """Mark notification as read."""
@@ -173,10 +210,10 @@ class NotificationManager:
 
     def get_unread_count(self) -> int:
         """Get count of unread notifications."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM notifications WHERE is_read = FALSE")
-        return cursor.fetchone()[0]
+        with self._acquire_reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM notifications WHERE is_read = FALSE")
+            return cursor.fetchone()[0]
 
     def delete_old_notifications(self, days: int = 30) -> int:
         """Delete notifications older than specified days."""
@@ -194,30 +231,29 @@ class NotificationManager:
             return 0
 
 
-# Bookmark and tag functions
+# Bookmark and tag functions. These are short UI calls where the
+# connect/close cycle outweighs the query, so they share the per-thread
+# persistent connection (WAL keeps them from blocking writers).
 def toggle_bookmark(news_id: int) -> bool:
     """Toggle bookmark status for a news item."""
-    conn = get_connection()
+    conn = get_thread_connection()
     cursor = conn.cursor()
-    try:
-        cursor.execute("SELECT is_bookmarked FROM news WHERE id = ?", (news_id,))
-        row = cursor.fetchone()
-        if row:
-            new_status = not (row[0] or False)
-            cursor.execute(
-                "UPDATE news SET is_bookmarked = ?, updated_at = ? WHERE id = ?",
-                (new_status, datetime.now(), news_id)
-            )
-            conn.commit()
-            return new_status
-        return False
-    finally:
-        conn.close()
+    cursor.execute("SELECT is_bookmarked FROM news WHERE id = ?", (news_id,))
+    row = cursor.fetchone()
+    if row:
+        new_status = not (row[0] or False)
+        cursor.execute(
+            "UPDATE news SET is_bookmarked = ?, updated_at = ? WHERE id = ?",
+            (new_status, datetime.now(), news_id)
+        )
+        conn.commit()
+        return new_status
+    return False
 
 
 def set_tags(news_id: int, tags: list) -> bool:
     """Set tags for a news item."""
-    conn = get_connection()
+    conn = get_thread_connection()
     cursor = conn.cursor()
     try:
         import json
@@ -231,74 +267,56 @@ def set_tags(news_id: int, tags: list) -> bool:
     except Exception as e:
         print(f"Error setting tags: {e}")
         return False
-    finally:
-        conn.close()
 
 
 def get_tags(news_id: int) -> list:
     """Get tags for a news item."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("SELECT tags FROM news WHERE id = ?", (news_id,))
-        row = cursor.fetchone()
-        if row and row[0]:
-            import json
-            return json.loads(row[0])
-        return []
-    finally:
-        conn.close()
+    cursor = get_thread_connection().cursor()
+    cursor.execute("SELECT tags FROM news WHERE id = ?", (news_id,))
+    row = cursor.fetchone()
+    if row and row[0]:
+        import json
+        return json.loads(row[0])
+    return []
 
 
 def get_all_tags() -> list:
     """Get all unique tags used across news items."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("SELECT DISTINCT tags FROM news WHERE tags IS NOT NULL AND tags != ''")
-        all_tags = set()
-        import json
-        for row in cursor.fetchall():
-            try:
-                tags = json.loads(row[0])
-                all_tags.update(tags)
-            except:
-                pass
-        return sorted(list(all_tags))
-    finally:
-        conn.close()
+    cursor = get_thread_connection().cursor()
+    cursor.execute("SELECT DISTINCT tags FROM news WHERE tags IS NOT NULL AND tags != ''")
+    all_tags = set()
+    import json
+    for row in cursor.fetchall():
+        try:
+            tags = json.loads(row[0])
+            all_tags.update(tags)
+        except:
+            pass
+    return sorted(list(all_tags))
 
 
 def get_bookmarked_news(limit: int = 50) -> list:
     """Get all bookmarked news items."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("""
-            SELECT * FROM news
-            WHERE is_bookmarked = TRUE
-            ORDER BY updated_at DESC
-            LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+    cursor = get_thread_connection().cursor()
+    cursor.execute("""
+        SELECT * FROM news
+        WHERE is_bookmarked = TRUE
+        ORDER BY updated_at DESC
+        LIMIT ?
+    """, (limit,))
+    return [dict(row) for row in cursor.fetchall()]
 
 
 def get_news_by_tag(tag: str, limit: int = 50) -> list:
     """Get news items with a specific tag."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("""
-            SELECT * FROM news
-            WHERE tags LIKE ?
-            ORDER BY importance_score DESC
-            LIMIT ?
-        """, (f'%"{tag}"%', limit))
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+    cursor = get_thread_connection().cursor()
+    cursor.execute("""
+        SELECT * FROM news
+        WHERE tags LIKE ?
+        ORDER BY importance_score DESC
+        LIMIT ?
+    """, (f'%"{tag}"%', limit))
+    return [dict(row) for row in cursor.fetchall()]
 
 
 if __name__ == "__main__":
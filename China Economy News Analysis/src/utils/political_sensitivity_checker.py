@@ -286,6 +286,48 @@ LOW_PATTERNS = [
 ]
 
 
+# All patterns compiled once at import; check_sensitivity only scans.
+# The source dicts above stay as the single point of edit.
+_PATTERN_META: list[tuple[Severity, dict]] = [
+    (severity, p)
+    for patterns, severity in (
+        (CRITICAL_PATTERNS, Severity.CRITICAL),
+        (HIGH_PATTERNS, Severity.HIGH),
+        (MEDIUM_PATTERNS, Severity.MEDIUM),
+        (LOW_PATTERNS, Severity.LOW),
+    )
+    for p in patterns
+]
+
+_COMPILED_PATTERNS = [
+    (re.compile(p["pattern"], re.IGNORECASE), p, severity)
+    for severity, p in _PATTERN_META
+]
+
+# Fused alternation used ONLY as a clean-text pre-filter: one linear scan
+# decides whether any pattern matches at all, and most inputs are clean.
+# It must not drive detection itself — finditer yields non-overlapping
+# leftmost matches, so a greedy low-severity alternative (e.g. 중국.*낙후)
+# can swallow a higher-severity match inside its span and un-block text
+# the checker exists to block. Inner groups are rewritten non-capturing.
+_UNION_RE = re.compile(
+    "|".join(
+        re.sub(r'[(](?![?])', '(?:', p['pattern'])
+        for _, p in _PATTERN_META
+    ),
+    re.IGNORECASE,
+)
+
+# All auto_fix pairs fused the same way: one substitution pass replaces
+# the per-issue str.replace chain (each of which re-scanned the text).
+_AUTOFIX_MAP = {
+    p["auto_fix"][0]: p["auto_fix"][1]
+    for _, p in _PATTERN_META
+    if p.get("auto_fix")
+}
+_AUTOFIX_RE = re.compile("|".join(re.escape(k) for k in _AUTOFIX_MAP))
+
+
 def check_sensitivity(text: str) -> CheckResult:
     """Check text for political sensitivity issues.
 
@@ -298,41 +340,39 @@ def check_sensitivity(text: str) -> CheckResult:
     if not text:
         return CheckResult(original="", corrected="", issues=[], blocked=False)
 
-    issues = []
-    corrected = text
+    if not _UNION_RE.search(text):
+        return CheckResult(original=text, corrected=text, issues=[])
 
-    # Check all pattern groups
-    all_patterns = [
-        (CRITICAL_PATTERNS, Severity.CRITICAL),
-        (HIGH_PATTERNS, Severity.HIGH),
-        (MEDIUM_PATTERNS, Severity.MEDIUM),
-        (LOW_PATTERNS, Severity.LOW),
-    ]
-
-    for patterns, severity in all_patterns:
-        for p in patterns:
-            regex = re.compile(p["pattern"], re.IGNORECASE)
-            for match in regex.finditer(text):
-                # Extract context
-                start = max(0, match.start() - 30)
-                end = min(len(text), match.end() + 30)
-                context = text[start:end]
-
-                issue = SensitivityIssue(
-                    severity=severity,
-                    category=p["category"],
-                    pattern=p["pattern"],
-                    match=match.group(),
-                    context=context,
-                    description=p["description"],
-                    recommendation=p["recommendation"],
-                    auto_fix=p.get("auto_fix"),
-                )
-                issues.append(issue)
-
-                # Apply auto-fix if available
-                if issue.auto_fix:
-                    corrected = corrected.replace(issue.auto_fix[0], issue.auto_fix[1])
+    issues = []
+    has_fix = False
+
+    # Per-pattern scan: every pattern sees the full text, so overlapping
+    # matches across (and within) severity tiers are all reported, exactly
+    # as before the union pre-filter existed.
+    for regex, p, severity in _COMPILED_PATTERNS:
+      for match in regex.finditer(text):
+        # Extract context
+        start = max(0, match.start() - 30)
+        end = min(len(text), match.end() + 30)
+        context = text[start:end]
+
+        issue = SensitivityIssue(
+            severity=severity,
+            category=p["category"],
+            pattern=p["pattern"],
+            match=match.group(),
+            context=context,
+            description=p["description"],
+            recommendation=p["recommendation"],
+            auto_fix=p.get("auto_fix"),
+        )
+        issues.append(issue)
+        has_fix = has_fix or issue.auto_fix is not None
+
+    # Apply all auto-fixes in one substitution pass
+    corrected = (
+        _AUTOFIX_RE.sub(lambda m: _AUTOFIX_MAP[m.group(0)], text) if has_fix else text
+    )
 
     # Determine if blocked
     has_critical = any(i.severity == Severity.CRITICAL for i in issues)
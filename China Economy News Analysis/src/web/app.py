@@ -15,8 +15,7 @@ import bleach
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from src.api.public_feed import (
-    get_published_news,
-    get_published_news_count,
+    get_published_news_with_count,
     get_news_by_id,
     get_published_news_by_date,
     get_available_dates,
@@ -80,9 +79,8 @@ def index():
     per_page = app.config["ITEMS_PER_PAGE"]
     offset = (page - 1) * per_page
 
-    # Get news and total count
-    news_list = get_published_news(limit=per_page, offset=offset)
-    total_count = get_published_news_count()
+    # Get news page and total count in a single query
+    news_list, total_count = get_published_news_with_count(limit=per_page, offset=offset)
     total_pages = (total_count + per_page - 1) // per_page
 
     # Group by date